@@ -1,36 +1,112 @@
 import gradio as gr
+import asyncio
 import re
 import random
 import json
+import hashlib
+import textwrap
+import orjson
+import httpx
+from collections.abc import AsyncIterator
+from functools import lru_cache
+import diskcache
 from dotenv import load_dotenv
 import os
-from openai import OpenAI
+import openai
+from openai import AsyncOpenAI
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 
 # 🔐 Load API Key from .env
 load_dotenv()
 api_key = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=api_key)
+
+# One pooled HTTP/2 connection is multiplexed across all concurrent calls
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=60,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+)
+# Single process-wide client; retries are handled by _openai_call, not the SDK
+aclient = AsyncOpenAI(api_key=api_key, http_client=http_client, max_retries=0, timeout=60.0)
+
+# Small, fast model for keyword extraction/summaries; GPT-4 for the creative ideas
+KW_MODEL = os.getenv("KW_MODEL", "gpt-4o-mini")
+IDEA_MODEL = os.getenv("IDEA_MODEL", "gpt-4")
+
+# Every OpenAI request acquires this before dispatching
+_OPENAI_SEM = asyncio.Semaphore(int(os.getenv("OPENAI_MAX_CONCURRENCY", "10")))
+
+def _retrying(*exc_types):
+    return retry(
+        wait=wait_random_exponential(min=1, max=30),
+        stop=stop_after_attempt(6),
+        retry=retry_if_exception_type(exc_types),
+        reraise=True
+    )
+
+# Rate-limited, dropped or 5xx requests are retried with jittered backoff
+@_retrying(
+    openai.RateLimitError,
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.InternalServerError
+)
+async def _openai_call(method, *args, **kwargs):
+    async with _OPENAI_SEM:
+        return await method(*args, **kwargs)
+
+# For non-idempotent creates (files, batches) only a 429 is safe to retry:
+# a dropped connection may already have created the object server-side
+@_retrying(openai.RateLimitError)
+async def _openai_create(method, *args, **kwargs):
+    async with _OPENAI_SEM:
+        return await method(*args, **kwargs)
+
+# Web search is optional; when enabled it may hold up the pipeline for at most this long
+ENABLE_WEB_SEARCH = os.getenv("ENABLE_WEB_SEARCH", "1") == "1"
+WEB_SEARCH_TIMEOUT = float(os.getenv("WEB_SEARCH_TIMEOUT", "8"))
+
+# Send keyword summaries through the (cheaper, slower) Batch API instead
+USE_BATCH_API = os.getenv("USE_BATCH_API", "0") == "1"
+BATCH_POLL_TIMEOUT = float(os.getenv("BATCH_POLL_TIMEOUT", "300"))
+
+# 🗄️ GPT responses cached on disk, keyed by model + prompt
+cache = diskcache.Cache("./cache")
+
+def _cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256((model + prompt).encode("utf-8")).hexdigest()
 
 # 1) Load your product catalog once at startup
+# Only unusually long descriptions get shortened; current entries are all under 600 chars
+PRODUCT_DESC_MAX_CHARS = int(os.getenv("PRODUCT_DESC_MAX_CHARS", "1000"))
+_PRODUCT_MD: dict[str, str] = {}
+
 def load_product_catalog(path="products.json"):
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
     # Expecting products_desc to be a dict: { "iboothme X": "…", … }
-    return data["products_desc"]
+    catalog = data["products_desc"]
+    # Pre-render each product's markdown block so requests only join strings
+    _PRODUCT_MD.clear()
+    # shorten() also collapses whitespace, so only apply it to over-long entries
+    _PRODUCT_MD.update({
+        name: f"**{name}**\n" + (
+            desc if len(desc) <= PRODUCT_DESC_MAX_CHARS
+            else textwrap.shorten(desc, width=PRODUCT_DESC_MAX_CHARS, placeholder='…')
+        )
+        for name, desc in catalog.items() if desc
+    })
+    return catalog
 
 PRODUCT_CATALOG = load_product_catalog()
+PRODUCT_KEYS = tuple(PRODUCT_CATALOG.keys())
 
 # 2) Helper to pull full descriptions for a list of product names
-def get_product_descriptions(product_names: list[str]) -> str:
-    entries = []
-    for name in product_names:
-        desc = PRODUCT_CATALOG.get(name)
-        if desc:
-            entries.append(f"**{name}**\n{desc}")
-    return "\n\n".join(entries)
+@lru_cache(maxsize=256)
+def get_product_descriptions(product_names: tuple[str, ...]) -> str:
+    return "\n\n".join(_PRODUCT_MD[n] for n in product_names if n in _PRODUCT_MD)
 
 # Keyword extraction from the paragraph
-def extract_keywords(paragraph: str) -> list[str]:
+async def extract_keywords(paragraph: str, force_refresh: bool = False) -> list[str]:
     prompt = f"""
 You are an expert in experiential event planning.
 
@@ -43,17 +119,24 @@ Event Description:
 
 Return the keywords as a comma-separated list.
 """
-    response = client.chat.completions.create(
-        model="gpt-4",
+    key = _cache_key(KW_MODEL, prompt)
+    if not force_refresh and key in cache:
+        return json.loads(cache[key])
+    response = await _openai_call(
+        aclient.chat.completions.create,
+        model=KW_MODEL,
         messages=[{"role": "user", "content": prompt}],
         temperature=0.7,
         max_tokens=200
     )
     raw = response.choices[0].message.content
-    return [kw.strip().lower() for kw in re.split(r'[,\n]', raw) if kw.strip()]
+    parts = raw.replace('\n', ',').split(',')
+    keywords = list(dict.fromkeys(kw.strip().lower() for kw in parts if kw.strip()))
+    cache[key] = json.dumps(keywords)
+    return keywords
 
 # (Optional) Keyword extraction from titles/links
-def extract_keywords_from_title_and_link(title: str, link: str) -> list[str]:
+async def extract_keywords_from_title_and_link(title: str, link: str, force_refresh: bool = False) -> list[str]:
     prompt = f"""
 You are an expert in event innovation.
 
@@ -64,20 +147,28 @@ Link: {link}
 
 Return the keywords as a comma-separated list.
 """
-    response = client.chat.completions.create(
-        model="gpt-4",
+    key = _cache_key(KW_MODEL, prompt)
+    if not force_refresh and key in cache:
+        return json.loads(cache[key])
+    response = await _openai_call(
+        aclient.chat.completions.create,
+        model=KW_MODEL,
         messages=[{"role": "user", "content": prompt}],
         temperature=0.6,
         max_tokens=150
     )
     raw = response.choices[0].message.content
-    return [kw.strip().lower() for kw in re.split(r'[,\n]', raw) if kw.strip()]
+    parts = raw.replace('\n', ',').split(',')
+    keywords = list(dict.fromkeys(kw.strip().lower() for kw in parts if kw.strip()))
+    cache[key] = json.dumps(keywords)
+    return keywords
 
 # (Optional) Web search for inspiration
-def search_similar_events_and_products_openai(keywords: list[str]) -> list[tuple[str,str]]:
+async def search_similar_events_and_products_openai(keywords: list[str]) -> list[tuple[str,str]]:
     input_text = f"Generate 10 useful URLs for experiential event ideas or iboothme.com inspiration related to the keywords: {', '.join(keywords)}"
     try:
-        response = client.responses.create(
+        response = await _openai_call(
+            aclient.responses.create,
             model="gpt-4.1",
             tools=[{"type": "web_search_preview"}],
             input=input_text
@@ -97,44 +188,33 @@ def search_similar_events_and_products_openai(keywords: list[str]) -> list[tuple
         print("Search failed:", e)
         return []
 
-# Core idea generation, enriched with random product descriptions
-def generate_event_ideas(
-    paragraph: str,
-    product_info: str,
-    search_links: list[tuple[str,str]],
-    all_keywords: list[str],
-    idea_count: int
-) -> str:
-    search_summary = "\n".join([f"- {title}: {url}" for title, url in search_links])
-    include_games = any("game" in kw for kw in all_keywords)
-    game_instruction = "Include at least two game-related ideas (e.g., quiz game, vending challenge)." if include_games else ""
+# Human-readable title for a search result, or None if it is only a URL
+_MD_LINK = re.compile(r'\[([^\]]+)\]\([^)]*\)')
+_LIST_MARKER = re.compile(r'^\s*(?:[-*]|\d+[.)])\s*')
 
-    prompt = f"""
-You are an expert event strategist for iboothme, a company offering creative experiences like AI photo booths, smart vending machines, audio booths, personalization stations, and immersive visual storytelling.
+def _link_title(title: str, url: str) -> str | None:
+    m = _MD_LINK.search(title)
+    if m:
+        title = m.group(1)
+    title = _LIST_MARKER.sub("", title).strip("* ")
+    if not title or title == url or "http" in title:
+        return None
+    return title
 
-Below are full descriptions of three randomly selected iboothme products, to keep all ideas on-brand:
-{product_info}
+# Fixed instructions for idea generation, sent as the system message; only
+# per-request data goes in the user message
+SYSTEM_PROMPT = """You are an expert event strategist for iboothme, a company offering creative experiences like AI photo booths, smart vending machines, audio booths, personalization stations, and immersive visual storytelling.
+Always write the brand as "iboothme" (all lowercase).
 
-Based on the event description below, generate {idea_count} unique and diverse iboothme-powered event ideas.
-Make sure that the syntax of the brand is always "iboothme" (all lowercase).
-
-**Event Description:**
-{paragraph}
-
-**Inspiration from Related Ideas:**
-{search_summary}
-
-💡 **Your Task:**
-Create ideas that are immersive, memorable, and creatively use iboothme's photo, video, and audio-based technologies. Do not use AR, VR, projection mapping, or other tech-heavy elements.
+Create ideas that are immersive, memorable, and creatively use iboothme's photo, video, and audio-based technologies.
 
 You must include:
 - At least two game-related ideas
 - Studio Ghibli-inspired visuals in one idea
 - Personalized giveaways (e.g., custom t-shirts, stickers, Labibu dolls)
-{game_instruction}
 
 ❗ Important:
-- Avoid AR, VR, holograms, or projection domes
+- Avoid AR, VR, holograms, projection mapping/domes, or other tech-heavy elements
 - Do not repeat photo‑booth formats
 - Every idea should have a creative title
 - Each idea should be described in a paragraph
@@ -142,82 +222,316 @@ You must include:
 
 Return **only** the final ideas in markdown format.
 """
-    resp = client.chat.completions.create(
-        model="gpt-4",
-        messages=[{"role": "user", "content": prompt}],
+
+# Core idea generation, enriched with random product descriptions
+async def generate_event_ideas(
+    paragraph: str,
+    product_info: str,
+    search_links: list[tuple[str,str]],
+    include_games: bool,
+    idea_count: int
+) -> AsyncIterator[str]:
+    # Titles alone carry the inspiration; URLs only cost tokens
+    titles = [t for t in (_link_title(title, url) for title, url in search_links) if t]
+    search_summary = "\n".join(f"- {title}" for title in titles[:5])
+    game_instruction = "Make the game-related ideas fit this event (e.g., quiz game, vending challenge)." if include_games else ""
+
+    prompt = f"""
+iboothme products to keep all ideas on-brand:
+{product_info}
+
+**Event Description:**
+{paragraph}
+
+**Inspiration from Related Ideas:**
+{search_summary}
+
+Generate {idea_count} unique and diverse iboothme-powered event ideas.
+{game_instruction}
+"""
+    stream = await _openai_call(
+        aclient.chat.completions.create,
+        model=IDEA_MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
         temperature=0.95,
-        max_tokens=1500
+        max_tokens=1500,
+        stream=True
+    )
+    async for chunk in stream:
+        if chunk.choices:
+            yield chunk.choices[0].delta.content or ""
+
+# One-line description per keyword, all keywords in a single request
+async def summarize_keywords(keywords: list[str], force_refresh: bool = False) -> list[tuple[str, str | None]]:
+    if not keywords:
+        return []
+    print("Summarizing keywords:", keywords)
+    prompt = (
+        "For each keyword below, give a short one-line event idea description. "
+        'Return a JSON object of the form {"summaries": [{"index": ..., "keyword": ..., "description": ...}]}, '
+        "where index is the keyword's number in the list.\n"
+        + "\n".join(f"{i+1}. {kw}" for i, kw in enumerate(keywords))
+    )
+    key = _cache_key(KW_MODEL, prompt)
+    if not force_refresh and key in cache:
+        return [tuple(pair) for pair in json.loads(cache[key])]
+    try:
+        r = await _openai_call(
+            aclient.chat.completions.create,
+            model=KW_MODEL,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+            temperature=0.6,
+            max_tokens=60 * len(keywords)
+        )
+        raw = r.choices[0].message.content
+    except Exception as e:
+        print("Error summarizing keywords:", e)
+        return [(kw, None) for kw in keywords]
+
+    descs = {}
+    try:
+        for item in json.loads(raw)["summaries"]:
+            desc = str(item["description"]).strip()
+            # Join on the echoed index, since the model sometimes rewords a keyword
+            try:
+                i = int(item["index"]) - 1
+            except (KeyError, TypeError, ValueError):
+                descs[str(item["keyword"]).strip().lower()] = desc
+                continue
+            if 0 <= i < len(keywords):
+                descs[keywords[i].lower()] = desc
+    except (ValueError, KeyError, TypeError) as e:
+        # Fall back to "1. keyword: description" style numbered lines
+        print("Could not parse keyword summaries as JSON:", e)
+        for m in re.finditer(r'^\s*(\d+)[.)]\s*(.+)$', raw or "", re.MULTILINE):
+            i = int(m.group(1)) - 1
+            if 0 <= i < len(keywords):
+                line = m.group(2).strip("* ")
+                if line.lower().startswith(keywords[i].lower()):
+                    line = line[len(keywords[i]):].lstrip("*:-–— ")
+                descs[keywords[i].lower()] = line
+    pairs = [(kw, descs.get(kw.lower()) or None) for kw in keywords]
+    # Only cache complete answers so a partial parse gets retried next time
+    if all(desc for _, desc in pairs):
+        cache[key] = json.dumps(pairs)
+    return pairs
+
+# Batch API variant: one request per keyword, polled until the batch finishes
+_BATCH_DONE = ("completed", "failed", "expired", "cancelled")
+
+def _summary_prompt(kw: str) -> str:
+    return f"Give a short one-line event idea description using the keyword: {kw}"
+
+async def summarize_keywords_batch(keywords: list[str], force_refresh: bool = False) -> list[tuple[str, str | None]]:
+    if not keywords:
+        return []
+    descs = {}
+    if not force_refresh:
+        for kw in keywords:
+            key = _cache_key(KW_MODEL, _summary_prompt(kw))
+            if key in cache:
+                descs[kw] = json.loads(cache[key])
+    pending = [kw for kw in keywords if kw not in descs]
+    if pending:
+        for kw, desc in (await _run_summary_batch(pending)).items():
+            descs[kw] = desc
+            cache[_cache_key(KW_MODEL, _summary_prompt(kw))] = json.dumps(desc)
+    return [(kw, descs.get(kw)) for kw in keywords]
+
+async def _run_summary_batch(keywords: list[str]) -> dict[str, str]:
+    print("Summarizing keywords via Batch API:", keywords)
+    lines = [
+        json.dumps({
+            "custom_id": f"kw-{i}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": KW_MODEL,
+                "messages": [{"role": "user", "content": _summary_prompt(kw)}],
+                "temperature": 0.6,
+                "max_tokens": 60
+            }
+        })
+        for i, kw in enumerate(keywords)
+    ]
+    batch_file = batch = None
+    try:
+        batch_file = await _openai_create(
+            aclient.files.create,
+            file=("keyword_summaries.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await _openai_create(
+            aclient.batches.create,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+            input_file_id=batch_file.id
+        )
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + BATCH_POLL_TIMEOUT
+        delay = 2
+        while batch.status not in _BATCH_DONE:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                print(f"Batch not finished after {BATCH_POLL_TIMEOUT}s; giving up.")
+                return {}
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, 60)
+            batch = await _openai_call(aclient.batches.retrieve, batch.id)
+        print("Batch finished with status:", batch.status)
+        if batch.status != "completed" or not batch.output_file_id:
+            return {}
+        output = await _openai_call(aclient.files.content, batch.output_file_id)
+    except Exception as e:
+        print("Error summarizing keywords via Batch API:", e)
+        return {}
+    finally:
+        # Runs on timeout, error and task cancellation alike, so nothing is left billing or stored
+        await _cleanup_batch(batch_file, batch)
+
+    descs = {}
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+            body = item["response"]["body"]
+            descs[keywords[int(item["custom_id"].removeprefix("kw-"))]] = body["choices"][0]["message"]["content"].strip()
+        except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+            print("Batch request failed:", line[:200])
+    return descs
+
+async def _cleanup_batch(batch_file, batch) -> None:
+    file_ids = [batch_file.id] if batch_file else []
+    if batch is not None:
+        if batch.status not in _BATCH_DONE:
+            try:
+                await _openai_call(aclient.batches.cancel, batch.id)
+                print("Cancelled batch:", batch.id)
+            except Exception as e:
+                print("Error cancelling batch:", e)
+        file_ids += [f for f in (batch.output_file_id, batch.error_file_id) if f]
+    for file_id in file_ids:
+        try:
+            await _openai_call(aclient.files.delete, file_id)
+        except Exception as e:
+            print(f"Error deleting batch file {file_id}:", e)
+
+# Markdown bullet list of one-line keyword summaries
+async def gather_summaries(keywords: list[str]) -> str:
+    if USE_BATCH_API:
+        pairs = await summarize_keywords_batch(keywords)
+    else:
+        pairs = await summarize_keywords(keywords)
+    return "\n".join(
+        f"- **{kw.title()}**: {desc}" if desc else f"- **{kw.title()}**"
+        for kw, desc in pairs
     )
-    return resp.choices[0].message.content
 
 # Main orchestration
-def main_workflow(paragraph: str) -> str:
+async def main_workflow(paragraph: str) -> AsyncIterator[str]:
     print("main_workflow called with paragraph:", paragraph)
     if not paragraph.strip():
         print("No paragraph provided.")
-        return "❌ Please enter an event description."
+        yield "❌ Please enter an event description."
+        return
+
+    # Start keyword extraction now so its round-trip overlaps product selection
+    kw_task = asyncio.create_task(extract_keywords(paragraph))
 
     # 1. Randomly pick 3 products from your catalog
     try:
-        gadget_names = random.sample(list(PRODUCT_CATALOG.keys()), k=4)
+        gadget_names = random.sample(PRODUCT_KEYS, k=4)
         print("Randomly selected products:", gadget_names)
-        product_info = get_product_descriptions(gadget_names)
+        product_info = get_product_descriptions(tuple(sorted(gadget_names)))
     except Exception as e:
+        kw_task.cancel()
         print("Error selecting products:", e)
-        return f"❌ Error selecting products: {e}"
+        yield f"❌ Error selecting products: {e}"
+        return
 
     # 2. Gather keywords + optional web search
     try:
-        base_kw = extract_keywords(paragraph)
+        base_kw = await kw_task
         print("Extracted base keywords:", base_kw)
-        links = search_similar_events_and_products_openai(base_kw)
+        links = []
+        if ENABLE_WEB_SEARCH:
+            try:
+                links = await asyncio.wait_for(
+                    search_similar_events_and_products_openai(base_kw),
+                    timeout=WEB_SEARCH_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                print(f"Web search timed out after {WEB_SEARCH_TIMEOUT}s; continuing without links.")
         print("Found links:", links)
-        link_kw = []
-        for t, u in links:
-            kws = extract_keywords_from_title_and_link(t, u)
-            print(f"Extracted keywords from link ({t}, {u}):", kws)
-            link_kw.extend(kws)
-        all_kw = sorted(set(base_kw + link_kw))
+        # Extract keywords from all links concurrently; a failed link is skipped
+        results = await asyncio.gather(
+            *[extract_keywords_from_title_and_link(t, u) for t, u in links],
+            return_exceptions=True
+        )
+        for (t, u), r in zip(links, results):
+            if isinstance(r, Exception):
+                print(f"Error extracting keywords from link ({t}, {u}):", r)
+            else:
+                print(f"Extracted keywords from link ({t}, {u}):", r)
+        all_kw = sorted({
+            *base_kw,
+            *(k for r in results if not isinstance(r, Exception) for k in r)
+        })
         print("All keywords:", all_kw)
+        include_games = any("game" in kw for kw in all_kw)
     except Exception as e:
         print("Error in keyword extraction or web search:", e)
-        return f"❌ Error in keyword extraction or web search: {e}"
-
-    # 3. Generate ideas
-    try:
-        idea_count = random.choice([5,6,7,8])
-        print("Idea count:", idea_count)
-        ideas_md = generate_event_ideas(paragraph, product_info, links, all_kw, idea_count)
-        print("Generated ideas markdown.")
-    except Exception as e:
-        print("Error generating ideas:", e)
-        return f"❌ Error generating ideas: {e}"
-
-    # 4. Summarize top keywords
-    summaries = []
-    for kw in all_kw[:10]:
-        try:
-            print(f"Summarizing keyword: {kw}")
-            r = client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": f"Give a short one-line event idea description using the keyword: {kw}"}],
-                temperature=0.6,
-                max_tokens=60
-            )
-            desc = r.choices[0].message.content.strip()
-            summaries.append(f"- **{kw.title()}**: {desc}")
-        except Exception as e:
-            print(f"Error summarizing keyword {kw}:", e)
-            summaries.append(f"- **{kw.title()}**")
-
-    summary_md = "\n".join(summaries)
-    print("Returning final markdown output.")
-    return f"""
+        yield f"❌ Error in keyword extraction or web search: {e}"
+        return
+
+    # 3. Summarize top keywords alongside idea generation; neither depends on the other
+    top_kw = all_kw[:10]
+    summaries_task = asyncio.create_task(gather_summaries(top_kw))
+
+    def render(ideas_md: str) -> str:
+        if not summaries_task.done():
+            summary_md = "_Summarizing keywords…_"
+        elif summaries_task.cancelled() or summaries_task.exception():
+            # A failed summary step only costs the descriptions, not the ideas
+            summary_md = "\n".join(f"- **{kw.title()}**" for kw in top_kw)
+        else:
+            summary_md = summaries_task.result()
+        return f"""
 🌐 **Relevant Keywords Summary:**  
 {summary_md}
 
 {ideas_md}
 """
+
+    try:
+        # 4. Generate ideas, streaming them below the summary as tokens arrive
+        try:
+            idea_count = random.choice([5,6,7,8])
+            print("Idea count:", idea_count)
+            ideas_md = ""
+            async for piece in generate_event_ideas(paragraph, product_info, links, include_games, idea_count):
+                ideas_md += piece
+                yield render(ideas_md)
+            print("Generated ideas markdown.")
+        except Exception as e:
+            print("Error generating ideas:", e)
+            yield f"❌ Error generating ideas: {e}"
+            return
+
+        await asyncio.wait({summaries_task})
+        if not summaries_task.cancelled() and summaries_task.exception():
+            print("Error summarizing keywords:", summaries_task.exception())
+        print("Returning final markdown output.")
+        yield render(ideas_md)
+    finally:
+        # Also stops the summaries (e.g. Batch API polling) if Gradio closes the generator
+        summaries_task.cancel()
+
 # 8) Styling and Gradio interface
 custom_theme = gr.themes.Base(
     primary_hue="purple",
@@ -295,4 +609,4 @@ with gr.Blocks(theme=custom_theme, css=custom_css, title="iboothme Event Ideatio
         show_progress=True
     )
 
-demo.launch(inline=False, share=True)
\ No newline at end of file
+demo.launch(inline=False, share=True)